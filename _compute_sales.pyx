@@ -0,0 +1,28 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Núcleo opcional en Cython para computeSales.py.
+
+Baja el ciclo caliente de totales por línea a C con locales tipados
+(double / Py_ssize_t), eliminando el despacho del intérprete por
+registro. computeSales.py lo importa si está compilado y si no usa
+sus rutas en Python.
+
+Compilación (opcional):
+    pip install cython
+    cythonize -i _compute_sales.pyx
+"""
+
+
+def sumar_lineas(list cantidades, list precios_unitarios):
+    """Totales por línea (cantidad * precio) y total general, en C."""
+    cdef Py_ssize_t i, n = len(cantidades)
+    cdef double total = 0.0
+    cdef double valor
+    cdef list totales = [0.0] * n
+
+    for i in range(n):
+        valor = <double> cantidades[i] * <double> precios_unitarios[i]
+        totales[i] = valor
+        total += valor
+
+    return totales, total
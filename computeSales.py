@@ -17,55 +17,152 @@ Este programa:
 
 from __future__ import annotations
 
+import functools
+import itertools
 import json
 import os
-import re
 import sys
 import time
-from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any, Optional
 
+try:
+    import orjson
+except ImportError:  # orjson es opcional; json de stdlib sigue funcionando
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson es opcional; sin él se carga la lista completa
+    ijson = None
+
+try:
+    import numpy as np
+except ImportError:  # numpy es opcional; hay una ruta pura en Python
+    np = None
+
+try:
+    import numba
+except ImportError:  # numba es opcional; sin él se usa numpy o Python puro
+    numba = None
+
+try:
+    import _compute_sales
+except ImportError:  # extensión Cython opcional; ver _compute_sales.pyx
+    _compute_sales = None
+
 
 RESULTS_DIR = "results"
 BASE_RESULT_NAME = "SalesResults"
 RESULT_EXTENSION = ".txt"
 SEPARATOR_LINE = "-" * 72
 TABLE_HEADER = "SALE_ID | SALE_Date | Product | Quantity | Unit Price | Line Total"
-
-
-@dataclass(frozen=True)
-class ErrorRegistro:
-    """Representa un error detectado en un registro, sin detener el programa."""
-    indice: int
-    mensaje: str
+# Plantilla %-format: en ciclos grandes es más barata que re-evaluar un
+# f-string con 6 interpolaciones por registro.
+LINE_TEMPLATE = "%d | %s | %s | %d | %s | %s"
+# Tamaño de trozo para la validación; con más de un trozo, los trozos se
+# reparten entre procesos (la validación es independiente por registro).
+CHUNK_RECORDS = 50_000
+# Mensajes de validación indexados por bit del bitmask de problemas;
+# el último lleva el nombre del producto como argumento %-format.
+VALIDATION_MESSAGES = (
+    "SALE_ID inválido o faltante",
+    "SALE_Date inválido o faltante",
+    "Product inválido o faltante",
+    "Quantity inválido o faltante",
+    "Quantity no puede ser negativa",
+    "Producto no existe en catálogo: '%s'",
+)
 
 
 def cargar_json(ruta: str) -> Any:
-    """Carga y parsea un archivo JSON."""
+    """
+    Carga y parsea un archivo JSON.
+
+    Usa orjson (parser en Rust, varias veces más rápido que json de stdlib)
+    cuando está instalado; si no, cae al json estándar.
+    """
+    if orjson is not None:
+        with open(ruta, "rb") as archivo:
+            # orjson es extensión en C; pylint no ve sus miembros.
+            # pylint: disable-next=no-member
+            return orjson.loads(archivo.read())
     with open(ruta, "r", encoding="utf-8") as archivo:
         return json.load(archivo)
 
 
+def cargar_ventas_stream(ruta: str):
+    """
+    Genera los registros de ventas uno por uno.
+
+    Con ijson instalado, los registros se leen en streaming desde el
+    archivo y la memoria pico es O(1) por registro en lugar de O(N).
+    Sin ijson se carga la lista completa y se itera sobre ella.
+    """
+    if ijson is not None:
+        with open(ruta, "rb") as archivo:
+            try:
+                eventos = ijson.parse(archivo, use_float=True)
+                # Mismo contrato que la ruta sin ijson: si el nivel
+                # superior no es una lista, es un error fatal (con
+                # ijson.items un objeto suelto produciría 0 registros
+                # en silencio).
+                primero = next(eventos, None)
+                if primero is None or primero[1] != "start_array":
+                    raise ValueError(
+                        "El archivo de ventas no contiene una lista "
+                        "de registros."
+                    )
+                yield from ijson.common.items(eventos, "item")
+            except ijson.JSONError as exc:
+                # ijson.JSONError no hereda de ValueError; se re-lanza
+                # como ValueError para que ejecutar() lo reporte igual
+                # que un JSON inválido en la ruta sin ijson.
+                raise ValueError(str(exc)) from exc
+        return
+
+    datos = cargar_json(ruta)
+    if not isinstance(datos, list):
+        raise ValueError(
+            "El archivo de ventas no contiene una lista de registros."
+        )
+    yield from datos
+
+
 def asegurar_carpeta_resultados() -> None:
     """Crea la carpeta de resultados si no existe."""
     os.makedirs(RESULTS_DIR, exist_ok=True)
 
 
+@functools.lru_cache(maxsize=4096)
 def formatear_moneda(valor: float) -> str:
-    """Formatea un número como moneda con 2 decimales."""
+    """
+    Formatea un número como moneda con 2 decimales.
+
+    Los precios unitarios vienen de un catálogo pequeño y se repiten
+    mucho entre registros; la memoización formatea cada valor distinto
+    una sola vez.
+    """
     return f"{valor:,.2f}"
 
 
-def construir_catalogo_precios(catalogo: Any) -> tuple[dict[str, float], list[str]]:
+def construir_catalogo_precios(
+    catalogo: Any,
+) -> tuple[dict[str, tuple[float, str]], list[str]]:
     """
-    Construye un diccionario {nombre_producto: precio} a partir del catálogo.
+    Construye un diccionario {nombre_producto: (precio, precio_formateado)}
+    a partir del catálogo.
+
+    Guardar el precio ya formateado junto al numérico permite que la ruta
+    caliente haga una sola búsqueda en el diccionario por registro.
 
     Se espera típicamente una lista de objetos con:
     - "title" (nombre del producto)
     - "price" (precio)
     """
     advertencias: list[str] = []
-    precios: dict[str, float] = {}
+    precios: dict[str, tuple[float, str]] = {}
 
     if not isinstance(catalogo, list):
         advertencias.append(
@@ -93,37 +190,57 @@ def construir_catalogo_precios(catalogo: Any) -> tuple[dict[str, float], list[st
             )
             continue
 
-        precios[titulo.strip()] = float(precio)
+        valor = float(precio)
+        # sys.intern en las claves: la búsqueda por producto en la ruta
+        # caliente se resuelve con comparación de punteros.
+        precios[sys.intern(titulo.strip())] = (valor, formatear_moneda(valor))
 
     return precios, advertencias
 
 
-def obtener_str(registro: dict[str, Any], clave: str) -> Optional[str]:
-    """Obtiene un campo string no vacío."""
-    valor = registro.get(clave)
-    if isinstance(valor, str) and valor.strip():
-        return valor.strip()
-    return None
-
-
-def obtener_int(registro: dict[str, Any], clave: str) -> Optional[int]:
+def validar_venta_rapida(
+    raw: Any,
+    precios: dict[str, tuple[float, str]],
+) -> Optional[tuple[int, str, str, int, tuple[float, str]]]:
     """
-    Obtiene un campo entero (o convertible a entero).
+    Validador especializado en el esquema observado de los registros.
 
-    Nota: evita aceptar bool (True/False) como int.
+    Asume directamente el esquema de 4 campos que traen los archivos
+    sanos (SALE_ID int, SALE_Date/Product str, Quantity int >= 0) y
+    devuelve la fila lista para acumular, o None para que el registro
+    pase al validador genérico (tipos laxos, campos faltantes, errores).
     """
-    valor = registro.get(clave)
-
-    if isinstance(valor, bool):
+    try:
+        sale_id = raw["SALE_ID"]
+        fecha = raw["SALE_Date"]
+        producto = raw["Product"]
+        cantidad = raw["Quantity"]
+    except (KeyError, TypeError):
         return None
 
-    if isinstance(valor, int):
-        return valor
-
-    if isinstance(valor, str):
-        texto = valor.strip()
-        if texto.isdigit():
-            return int(texto)
+    # type() exacto deliberado (excluye bool y es más barato que
+    # isinstance en la ruta caliente); la condición única es el punto.
+    # pylint: disable=unidiomatic-typecheck,too-many-boolean-expressions
+    if (
+        type(sale_id) is int
+        and type(cantidad) is int
+        and cantidad >= 0
+        and type(fecha) is str
+        and fecha.strip()
+        and type(producto) is str
+    ):
+        entrada = precios.get(producto.strip())
+        if entrada is not None:
+            # Fechas y productos se repiten muchísimo entre registros;
+            # internarlos colapsa las copias a un solo objeto por valor.
+            return (
+                sale_id,
+                sys.intern(fecha),
+                sys.intern(producto),
+                cantidad,
+                entrada,
+            )
+    # pylint: enable=unidiomatic-typecheck,too-many-boolean-expressions
 
     return None
 
@@ -131,149 +248,356 @@ def obtener_int(registro: dict[str, Any], clave: str) -> Optional[int]:
 def validar_registro_venta(
     indice: int,
     raw: Any,
-    precios: dict[str, float],
-) -> tuple[Optional[dict[str, Any]], list[str]]:
+    precios: dict[str, tuple[float, str]],
+) -> tuple[Optional[dict[str, Any]], Optional[tuple[float, str]], list[str]]:
     """
     Valida un registro de venta.
 
     Returns:
-        (registro_normalizado, problemas)
+        (registro_normalizado, entrada_precio, problemas)
         - registro_normalizado: dict si es válido estructuralmente, si no None.
+        - entrada_precio: tupla (precio, precio_formateado) del catálogo,
+          o None si el producto no existe. Se devuelve para que la ruta
+          caliente haga una sola búsqueda en el diccionario.
         - problemas: lista de problemas encontrados (vacía si todo está bien).
     """
-    problemas: list[str] = []
-
     if not isinstance(raw, dict):
-        problemas.append("Registro no es un objeto JSON (dict).")
-        return None, problemas
-
-    sale_id = obtener_int(raw, "SALE_ID")
-    sale_date = obtener_str(raw, "SALE_Date")
-    producto = obtener_str(raw, "Product")
-    cantidad = obtener_int(raw, "Quantity")
-
-    if sale_id is None:
-        problemas.append("SALE_ID inválido o faltante")
-    if sale_date is None:
-        problemas.append("SALE_Date inválido o faltante")
-    if producto is None:
-        problemas.append("Product inválido o faltante")
-    if cantidad is None:
-        problemas.append("Quantity inválido o faltante")
-    elif cantidad < 0:
-        problemas.append("Quantity no puede ser negativa")
-
-    if producto is not None and producto not in precios:
-        problemas.append(f"Producto no existe en catálogo: '{producto}'")
-
-    if problemas:
-        return raw, problemas
-
-    return raw, []
+        return None, None, ["Registro no es un objeto JSON (dict)."]
+
+    # Extracción en línea de los 4 campos: evita 4 llamadas a función
+    # por registro. type() exacto es más barato que isinstance en esta
+    # ruta caliente y además excluye bool como entero.
+    # pylint: disable=unidiomatic-typecheck
+    obtener = raw.get
+
+    # Para strings numéricos, int() hace un solo recorrido en C (isdigit
+    # + int eran dos), tolera espacios alrededor y acepta negativos;
+    # una Quantity negativa se rechaza después con su propio mensaje.
+    valor = obtener("SALE_ID")
+    if type(valor) is int:
+        sale_id: Optional[int] = valor
+    elif type(valor) is str:
+        try:
+            sale_id = int(valor)
+        except ValueError:
+            sale_id = None
+    else:
+        sale_id = None
+
+    valor = obtener("SALE_Date")
+    sale_date = valor.strip() or None if type(valor) is str else None
+
+    valor = obtener("Product")
+    producto = valor.strip() or None if type(valor) is str else None
+
+    valor = obtener("Quantity")
+    if type(valor) is int:
+        cantidad: Optional[int] = valor
+    elif type(valor) is str:
+        try:
+            cantidad = int(valor)
+        except ValueError:
+            cantidad = None
+    else:
+        cantidad = None
+    # pylint: enable=unidiomatic-typecheck
+
+    entrada = precios.get(producto) if producto is not None else None
+
+    # Bitmask de problemas acumulado sin ramas: en el caso común
+    # (registro válido) no se construye ninguna lista ni string.
+    flags = (
+        (sale_id is None)
+        | ((sale_date is None) << 1)
+        | ((producto is None) << 2)
+        | ((cantidad is None) << 3)
+        | ((cantidad is not None and cantidad < 0) << 4)
+        | ((producto is not None and entrada is None) << 5)
+    )
 
+    if not flags:
+        return raw, entrada, []
+
+    problemas = [
+        mensaje % producto if bit == 5 else mensaje
+        for bit, mensaje in enumerate(VALIDATION_MESSAGES)
+        if flags >> bit & 1
+    ]
+    # No se devuelve el dict crudo de un registro inválido: el reporte
+    # solo usa los mensajes, y así el dict se libera de inmediato en
+    # lugar de quedar retenido (importante con entrada en streaming).
+    return None, entrada, problemas
+
+
+def _sumar_lineas(qty, precio):
+    """Núcleo numérico: totales por línea y total general en una pasada."""
+    total = 0.0
+    totales = np.empty_like(precio)
+    for i in range(qty.size):
+        valor = qty[i] * precio[i]
+        totales[i] = valor
+        total += valor
+    return totales, total
+
+
+if numba is not None:
+    # Compilado a código máquina por LLVM; cache=True evita recompilar
+    # en ejecuciones posteriores.
+    _sumar_lineas = numba.njit(cache=True, fastmath=True)(_sumar_lineas)
+
+
+def calcular_totales_linea(
+    cantidades: list[int],
+    precios_unitarios: list[float],
+) -> tuple[list[float], float]:
+    """
+    Calcula los totales de línea (cantidad * precio) y el total general.
 
-def crear_linea_tabla(
+    Elige la mejor implementación disponible: la extensión Cython
+    (_compute_sales) si está compilada, luego el núcleo numba, luego la
+    versión vectorizada con numpy, y al final una ruta pura en Python.
+    """
+    if _compute_sales is not None:
+        return _compute_sales.sumar_lineas(cantidades, precios_unitarios)
+
+    n = len(cantidades)
+    if np is not None and n:
+        qty = np.fromiter(cantidades, dtype=np.int64, count=n)
+        precio = np.fromiter(precios_unitarios, dtype=np.float64, count=n)
+        if numba is not None:
+            totales, total = _sumar_lineas(qty, precio)
+            return totales.tolist(), float(total)
+        totales = precio * qty
+        return totales.tolist(), float(totales.sum())
+
+    totales_py = [p * c for p, c in zip(precios_unitarios, cantidades)]
+    return totales_py, sum(totales_py)
+
+
+@functools.lru_cache(maxsize=65536)
+# La clave de memoización necesita los 6 campos de la fila.
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def construir_linea(
     sale_id: int,
-    sale_date: str,
+    fecha: str,
     producto: str,
     cantidad: int,
-    precio_unitario: float,
-) -> tuple[str, float]:
-    """Crea una línea humana/legible para la tabla y devuelve también el total de línea."""
-    total_linea = precio_unitario * cantidad
-    linea = (
-        f"{sale_id} | {sale_date} | {producto} | {cantidad} | "
-        f"{formatear_moneda(precio_unitario)} | {formatear_moneda(total_linea)}"
+    precio_str: str,
+    total_str: str,
+) -> str:
+    """
+    Construye la línea de tabla de un registro.
+
+    En archivos reales aparecen registros duplicados (misma venta,
+    producto y cantidad); memoizar por la 6-tupla devuelve la línea ya
+    construida en esos casos y cuesta casi nada en el fallo de caché.
+    Las fechas y productos internados hacen el hash de la clave barato.
+    """
+    return LINE_TEMPLATE % (
+        sale_id, fecha, producto, cantidad, precio_str, total_str,
     )
-    return linea, total_linea
 
 
-def procesar_ventas(
-    precios: dict[str, float],
-    ventas: Any,
-) -> tuple[str, float, int, int]:
+def _procesar_trozo(
+    inicio: int,
+    trozo: list[Any],
+    precios: dict[str, tuple[float, str]],
+) -> tuple[tuple[list, ...], tuple[list[int], list[str]], int]:
     """
-    Procesa ventas y genera un reporte en texto.
+    Valida un trozo de registros y devuelve sus columnas acumuladas.
+
+    Corre igual en el proceso principal que en un trabajador del pool;
+    `inicio` es el índice (1-based) del primer registro del trozo.
 
     Returns:
-        (reporte, total, registros_validos, registros_invalidos)
+        (columnas, errores, invalidos), donde columnas es la tupla
+        (sale_ids, fechas, productos, cantidades, precios_unitarios,
+        precios_strs) y errores son dos listas paralelas
+        (indices, mensajes).
     """
-    errores: list[ErrorRegistro] = []
-    lineas: list[str] = []
-    total_general = 0.0
-    validos = 0
+    # Errores como listas paralelas (SoA): 2 appends de int/str por
+    # error, en lugar de instanciar un objeto por registro inválido.
+    err_indices: list[int] = []
+    err_mensajes: list[str] = []
     invalidos = 0
 
-    if not isinstance(ventas, list):
-        reporte_error = (
-            "ERROR: El archivo de ventas no contiene una lista de registros.\n"
-            "No se puede procesar.\n"
-        )
-        return reporte_error, 0.0, 0, 0
+    sale_ids: list[int] = []
+    fechas: list[str] = []
+    productos: list[str] = []
+    cantidades: list[int] = []
+    precios_unitarios: list[float] = []
+    precios_strs: list[str] = []
+
+    for idx, raw in enumerate(trozo, start=inicio):
+        fila = validar_venta_rapida(raw, precios)
+        if fila is None:
+            # Ruta genérica: tipos laxos (p. ej. enteros como string) o
+            # registros con problemas que hay que reportar.
+            registro, entrada, problemas = validar_registro_venta(
+                idx, raw, precios
+            )
+            if problemas:
+                invalidos += 1
+                err_indices.append(idx)
+                err_mensajes.append("; ".join(problemas))
+                continue
+
+            # Ya validado: existe y tiene campos correctos
+            assert registro is not None
+            assert entrada is not None
+            fila = (
+                int(registro["SALE_ID"]),
+                sys.intern(str(registro["SALE_Date"])),
+                sys.intern(str(registro["Product"])),
+                int(registro["Quantity"]),
+                entrada,
+            )
 
-    lineas.extend(
-        [
-            "Compute Sales - Results",
-            "",
-            "Detalle de ventas (se omiten registros inválidos, pero se reportan):",
-            "",
-            TABLE_HEADER,
-            SEPARATOR_LINE,
-        ]
+        sale_id, fecha, producto, cantidad, entrada = fila
+        precio_unitario, precio_str = entrada
+        sale_ids.append(sale_id)
+        fechas.append(fecha)
+        productos.append(producto)
+        cantidades.append(cantidad)
+        precios_unitarios.append(precio_unitario)
+        precios_strs.append(precio_str)
+
+    columnas = (
+        sale_ids, fechas, productos, cantidades,
+        precios_unitarios, precios_strs,
     )
+    return columnas, (err_indices, err_mensajes), invalidos
 
-    for idx, raw in enumerate(ventas, start=1):
-        registro, problemas = validar_registro_venta(idx, raw, precios)
-        if problemas:
-            invalidos += 1
-            mensaje = "; ".join(problemas)
-            errores.append(ErrorRegistro(indice=idx, mensaje=mensaje))
-            continue
 
-        # Ya validado: existe y tiene campos correctos
-        assert registro is not None
-        sale_id = int(registro["SALE_ID"])
-        sale_date = str(registro["SALE_Date"])
-        producto = str(registro["Product"])
-        cantidad = int(registro["Quantity"])
-
-        precio_unitario = precios[producto]
-        linea, total_linea = crear_linea_tabla(
-            sale_id=sale_id,
-            sale_date=sale_date,
-            producto=producto,
-            cantidad=cantidad,
-            precio_unitario=precio_unitario,
-        )
+def _en_trozos(ventas: Any, tamano: int):
+    """Genera trozos (listas) de a lo más `tamano` registros."""
+    iterador = iter(ventas)
+    while True:
+        trozo = list(itertools.islice(iterador, tamano))
+        if not trozo:
+            return
+        yield trozo
 
-        lineas.append(linea)
-        total_general += total_linea
-        validos += 1
 
-    lineas.extend(
-        [
-            "",
-            SEPARATOR_LINE,
-            f"Valid records: {validos}",
-            f"Invalid records: {invalidos}",
-            f"Total cost: {formatear_moneda(total_general)}",
-            "",
-        ]
+def _acumular_ventas(
+    precios: dict[str, tuple[float, str]],
+    ventas: Any,
+) -> tuple[tuple[list, ...], tuple[list[int], list[str]], int]:
+    """
+    Acumula las columnas de los registros válidos de todo el iterable.
+
+    Entradas que caben en un solo trozo se procesan en el proceso
+    principal, sin costo de pool ni pickling. Con más de un trozo, la
+    validación (independiente por registro) se reparte entre procesos
+    con ProcessPoolExecutor, que esquiva el GIL, y aquí solo se hace la
+    reducción de resultados parciales. Los envíos al pool se limitan a
+    os.cpu_count() trozos en vuelo: así la entrada en streaming nunca
+    está completa en memoria, solo la ventana de trozos pendientes.
+    """
+    trozos = _en_trozos(ventas, CHUNK_RECORDS)
+    primero = next(trozos, [])
+    segundo = next(trozos, None)
+
+    if segundo is None:
+        return _procesar_trozo(1, primero, precios)
+
+    max_en_vuelo = os.cpu_count() or 1
+    resultados = []
+    with ProcessPoolExecutor() as ejecutor:
+        pendientes: deque = deque()
+        inicio = 1
+        for trozo in itertools.chain([primero, segundo], trozos):
+            if len(pendientes) == max_en_vuelo:
+                # Se cosecha el futuro más antiguo antes de leer el
+                # siguiente trozo; los resultados quedan en orden.
+                resultados.append(pendientes.popleft().result())
+            pendientes.append(
+                ejecutor.submit(_procesar_trozo, inicio, trozo, precios)
+            )
+            inicio += len(trozo)
+        while pendientes:
+            resultados.append(pendientes.popleft().result())
+
+    columnas = tuple(
+        list(itertools.chain.from_iterable(cols))
+        for cols in zip(*(resultado[0] for resultado in resultados))
+    )
+    err_indices = list(
+        itertools.chain.from_iterable(r[1][0] for r in resultados)
+    )
+    err_mensajes = list(
+        itertools.chain.from_iterable(r[1][1] for r in resultados)
+    )
+    invalidos = sum(r[2] for r in resultados)
+    return columnas, (err_indices, err_mensajes), invalidos
+
+
+def procesar_ventas(
+    precios: dict[str, tuple[float, str]],
+    ventas: Any,
+) -> tuple[list[str], float, int, int, tuple[list[int], list[str]]]:
+    """
+    Procesa ventas y genera las líneas del reporte en texto.
+
+    Acepta cualquier iterable de registros (lista o generador de
+    streaming); cada registro se descarta tras procesarse. Devuelve las
+    líneas sin unir para que la escritura a disco pueda hacerse en
+    streaming, sin materializar el reporte como un solo string gigante.
+
+    Returns:
+        (lineas, total, registros_validos, registros_invalidos, errores),
+        con errores como dos listas paralelas (indices, mensajes).
+    """
+    cabecera = [
+        "Compute Sales - Results",
+        "",
+        "Detalle de ventas (se omiten registros inválidos, pero se reportan):",
+        "",
+        TABLE_HEADER,
+        SEPARATOR_LINE,
+    ]
+
+    # Columnas (SoA) de los registros válidos; la aritmética y el
+    # formato se hacen por lotes después del ciclo de validación.
+    columnas, errores, invalidos = _acumular_ventas(precios, ventas)
+    (sale_ids, fechas, productos, cantidades,
+     precios_unitarios, precios_strs) = columnas
+
+    validos = len(sale_ids)
+    totales_linea, total_general = calcular_totales_linea(
+        cantidades, precios_unitarios
     )
 
-    if errores:
-        lineas.extend(
-            [
-                "Errores detectados (la ejecución continuó):",
-                SEPARATOR_LINE,
-            ]
+    cuerpo = [
+        construir_linea(*fila)
+        for fila in zip(
+            sale_ids, fechas, productos, cantidades,
+            precios_strs, map(formatear_moneda, totales_linea),
         )
-        for err in errores:
-            lineas.append(f"[#{err.indice}] {err.mensaje}")
-        lineas.append("")
+    ]
+
+    pie = [
+        "",
+        SEPARATOR_LINE,
+        f"Valid records: {validos}",
+        f"Invalid records: {invalidos}",
+        f"Total cost: {formatear_moneda(total_general)}",
+        "",
+    ]
+
+    bloque_errores: list[str] = []
+    if errores[0]:
+        bloque_errores = [
+            "Errores detectados (la ejecución continuó):",
+            SEPARATOR_LINE,
+            *(f"[#{indice}] {mensaje}" for indice, mensaje in zip(*errores)),
+            "",
+        ]
 
-    reporte = "\n".join(lineas)
-    return reporte, total_general, validos, invalidos
+    # Concatenación única: la lista final se asigna de una vez a su
+    # tamaño exacto, sin los realloc+copy de crecer con append por línea.
+    lineas = cabecera + cuerpo + pie + bloque_errores
+    return lineas, total_general, validos, invalidos, errores
 
 
 def nombre_siguiente_resultado() -> str:
@@ -284,39 +608,70 @@ def nombre_siguiente_resultado() -> str:
       - results/SalesResults1.txt
       - results/SalesResults2.txt
     """
-    patron = re.compile(rf"^{re.escape(BASE_RESULT_NAME)}(\d+){re.escape(RESULT_EXTENSION)}$")
-    max_num = 0
+    # os.scandir evita el stat() por archivo de os.listdir+regex, y dos
+    # rebanadas de string son mucho más baratas que un match por nombre.
+    # max() sobre el generador corre su ciclo en C, sin la rama
+    # max_num = max(max_num, num) por archivo en Python.
+    prefijo = len(BASE_RESULT_NAME)
+    sufijo = len(RESULT_EXTENSION)
 
     try:
-        archivos = os.listdir(RESULTS_DIR)
+        with os.scandir(RESULTS_DIR) as entradas:
+            max_num = max(
+                (
+                    int(nombre[prefijo:-sufijo])
+                    for nombre in (entrada.name for entrada in entradas)
+                    if nombre.startswith(BASE_RESULT_NAME)
+                    and nombre.endswith(RESULT_EXTENSION)
+                    and nombre[prefijo:-sufijo].isdigit()
+                ),
+                default=0,
+            )
     except FileNotFoundError:
-        archivos = []
-
-    for nombre in archivos:
-        match = patron.match(nombre)
-        if match:
-            num = int(match.group(1))
-            if num > max_num:
-                max_num = num
+        max_num = 0
 
     siguiente = max_num + 1
     return f"{BASE_RESULT_NAME}{siguiente}{RESULT_EXTENSION}"
 
 
-def escribir_reporte(ruta_salida: str, reporte: str) -> None:
-    """Escribe el reporte en disco."""
+def escribir_reporte(ruta_salida: str, lineas: list[str]) -> None:
+    """
+    Escribe el reporte en disco línea por línea.
+
+    Usa un búfer de 1 MiB y writelines sobre un generador, así nunca se
+    construye el reporte completo como un string intermedio gigante.
+    """
+    with open(
+        ruta_salida, "w", encoding="utf-8", buffering=1 << 20
+    ) as archivo:
+        archivo.writelines(linea + "\n" for linea in lineas)
+
+
+def escribir_reporte_json(ruta_salida: str, payload: dict[str, Any]) -> None:
+    """
+    Escribe el resumen estructurado como JSON.
+
+    Con orjson la serialización es varias veces más rápida que
+    json.dumps y produce bytes listos para escribir directo.
+    """
+    if orjson is not None:
+        with open(ruta_salida, "wb") as archivo:
+            # orjson es extensión en C; pylint no ve sus miembros.
+            # pylint: disable-next=no-member
+            archivo.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        return
     with open(ruta_salida, "w", encoding="utf-8") as archivo:
-        archivo.write(reporte)
+        json.dump(payload, archivo, indent=2, ensure_ascii=False)
 
 
-def construir_bloque_advertencias(advertencias: list[str]) -> str:
-    """Construye un bloque de advertencias del catálogo para anteponer al reporte."""
+def construir_bloque_advertencias(advertencias: list[str]) -> list[str]:
+    """Construye las líneas de advertencias del catálogo para anteponer al reporte."""
     if not advertencias:
-        return ""
+        return []
     lineas = ["Advertencias del catálogo (no fatales):", SEPARATOR_LINE]
     lineas.extend(f"- {a}" for a in advertencias)
     lineas.append("")
-    return "\n".join(lineas)
+    return lineas
 
 
 def ejecutar(argv: list[str]) -> int:
@@ -336,7 +691,6 @@ def ejecutar(argv: list[str]) -> int:
 
     try:
         catalogo_json = cargar_json(ruta_catalogo)
-        ventas_json = cargar_json(ruta_ventas)
     except FileNotFoundError as exc:
         print(f"ERROR: No se encontró el archivo: {exc.filename}")
         return 1
@@ -347,26 +701,54 @@ def ejecutar(argv: list[str]) -> int:
     precios, advertencias = construir_catalogo_precios(catalogo_json)
 
     asegurar_carpeta_resultados()
-    reporte, _, _, _ = procesar_ventas(precios, ventas_json)
+
+    # Las ventas se consumen en streaming, así que los errores de lectura
+    # del archivo aparecen al iterar (dentro de procesar_ventas).
+    try:
+        lineas, total, validos, invalidos, errores = procesar_ventas(
+            precios, cargar_ventas_stream(ruta_ventas)
+        )
+    except FileNotFoundError as exc:
+        print(f"ERROR: No se encontró el archivo: {exc.filename}")
+        return 1
+    except json.JSONDecodeError as exc:
+        print(f"ERROR: JSON inválido en: {exc.msg}")
+        return 1
+    except ValueError as exc:
+        print(f"ERROR: {exc}")
+        return 1
 
     bloque_adv = construir_bloque_advertencias(advertencias)
     if bloque_adv:
-        reporte = bloque_adv + reporte
+        lineas = bloque_adv + lineas
 
-    # Guardar con nombre incremental
+    # Guardar con nombre incremental (reporte en texto + resumen JSON)
     nombre_salida = nombre_siguiente_resultado()
     ruta_salida = os.path.join(RESULTS_DIR, nombre_salida)
+    ruta_json = ruta_salida[: -len(RESULT_EXTENSION)] + ".json"
+
+    resumen = {
+        "valid": validos,
+        "invalid": invalidos,
+        "total": total,
+        "errors": [
+            {"index": indice, "message": mensaje}
+            for indice, mensaje in zip(*errores)
+        ],
+    }
 
     try:
-        escribir_reporte(ruta_salida, reporte)
+        escribir_reporte(ruta_salida, lineas)
+        escribir_reporte_json(ruta_json, resumen)
     except OSError as exc:
         print(f"ERROR: No se pudo escribir el archivo de resultados: {ruta_salida}")
         print(f"Detalle: {exc}")
         return 1
 
-    # También mostrar en consola
-    print(reporte)
+    # También mostrar en consola (solo aquí se une el reporte completo)
+    print("\n".join(lineas))
     print(f"\nArchivo de salida: {ruta_salida}")
+    print(f"Resumen JSON: {ruta_json}")
 
     return 0
 